@@ -8,11 +8,66 @@ COM: This file IS the Center of Mass for quantum-redstone
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from enum import Enum
+import atexit
+import bisect
+import functools
+import hashlib
 import json
+import math
+import mmap
 import os
-from datetime import datetime
+import random
+import re
+import string
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import numpy as np
+
+# Numba is optional: when present, the coherence metric inner loops run as
+# compiled native code; otherwise we fall back to the pure-Python analysis.
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# orjson is optional: faster serialization for the ATOM trail
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# xxhash is optional: faster content fingerprints for the analysis cache
+# (hash() is salted per process, so it cannot serve as a content key)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+if xxhash is not None:
+    def _content_key(raw: bytes) -> int:
+        return xxhash.xxh3_64_intdigest(raw)
+else:
+    def _content_key(raw: bytes) -> int:
+        return int.from_bytes(
+            hashlib.blake2b(raw, digest_size=8).digest(), 'big'
+        )
+
+if orjson is not None:
+    def _dump_entry(entry: Dict[str, Any]) -> bytes:
+        return orjson.dumps(entry)
+
+    _load_entry = orjson.loads
+else:
+    def _dump_entry(entry: Dict[str, Any]) -> bytes:
+        return json.dumps(
+            entry, separators=(',', ':'), ensure_ascii=False
+        ).encode('utf-8')
+
+    _load_entry = json.loads
 
 # Phase gates matching the ecosystem
 class Phase(Enum):
@@ -22,7 +77,7 @@ class Phase(Enum):
     SAIF = "SAIF"      # Assessment: results match theory
     SPIRAL = "SPIRAL"  # Learning: insights captured
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoherenceMetrics:
     """Mirrors the TypeScript wave-toolkit coherence structure"""
     curl: float         # Circular reasoning (0-1)
@@ -31,7 +86,7 @@ class CoherenceMetrics:
     entropy: float      # Information density (0-1)
     score: float        # Final coherence score (0-100)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuantumCircuitValidation:
     circuit_name: str
     minecraft_schematic: Optional[str]
@@ -39,10 +94,15 @@ class QuantumCircuitValidation:
     theoretical_claim: str
     validation_result: bool
     coherence: CoherenceMetrics
-    phases_passed: List[Phase]
+    phases_passed: int  # Bitmask: bit i set == phase at index i passed
     atom_tag: str
     timestamp: str
 
+    @property
+    def phases_passed_list(self) -> List[Phase]:
+        """Expand the phases_passed bitmask into Phase members."""
+        return [p for i, p in enumerate(_PHASES) if self.phases_passed >> i & 1]
+
 # The coherence formula - MUST match QDI/packages/wave-toolkit exactly
 def calculate_coherence(curl: float, divergence: float, potential: float, entropy: float) -> float:
     """
@@ -61,26 +121,323 @@ def calculate_coherence(curl: float, divergence: float, potential: float, entrop
     ) * 100
     return max(0, min(100, score))  # Clamp to 0-100
 
+# Hot scalar path: when numba is available, compile the formula so batched
+# callers pay native-call rather than interpreter overhead per score.
+# No fastmath here - the result MUST stay bit-identical to wave-toolkit.
+if _HAVE_NUMBA:
+    calculate_coherence = njit(calculate_coherence)
+
+def calculate_coherence_batch(curl, divergence, potential, entropy) -> np.ndarray:
+    """
+    Vectorized form of the COM formula for 1-D arrays of metrics.
+
+    Evaluates the same expression as calculate_coherence, term by term
+    and with out= arguments so no extra temporaries are allocated.
+    Scalar callers should keep calculate_coherence; analytic callers
+    scoring many circuits at once (bulk rescoring, parameter sweeps)
+    should use this instead of a Python loop.
+    """
+    curl = np.asarray(curl, dtype=np.float64)
+    potential = np.asarray(potential, dtype=np.float64)
+    entropy = np.asarray(entropy, dtype=np.float64)
+
+    score = np.multiply(curl, 0.4)
+    np.subtract(1.0, score, out=score)          # 1 - curl*0.4
+    term = np.subtract(divergence, 0.2)
+    np.abs(term, out=term)
+    term *= 0.3
+    score -= term                               # - |divergence-0.2|*0.3
+    np.subtract(1.0, potential, out=term)
+    term *= 0.2
+    score -= term                               # - (1-potential)*0.2
+    np.subtract(1.0, entropy, out=term)
+    term *= 0.1
+    score -= term                               # - (1-entropy)*0.1
+    score *= 100.0
+    np.clip(score, 0.0, 100.0, out=score)       # Clamp to 0-100
+    return score
+
 SNAP_IN_THRESHOLD = 70.0
 
+_ATOM_TAG_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+_atom_tag_rng = random.Random()
+
+# Lowercase + space-to-dash in a single C-level pass
+_SAFE_NAME_TABLE = str.maketrans(
+    string.ascii_uppercase + ' ', string.ascii_lowercase + '-'
+)
+
+@functools.lru_cache(maxsize=1)
+def _date_prefix(day_ordinal: int) -> str:
+    """Tag prefix for a given day; cached until the date rolls over."""
+    return f"ATOM-QR-{date.fromordinal(day_ordinal).strftime('%Y%m%d')}-"
+
 def generate_atom_tag(circuit_name: str) -> str:
     """Generate ATOM tag following ecosystem convention"""
-    date = datetime.now().strftime("%Y%m%d")
-    import random
-    hash_part = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789', k=3))
-    safe_name = circuit_name.lower().replace(' ', '-')[:20]
-    return f"ATOM-QR-{date}-{hash_part}-{safe_name}"
+    prefix = _date_prefix(date.today().toordinal())
+    hash_part = ''.join(_atom_tag_rng.choices(_ATOM_TAG_ALPHABET, k=3))
+    safe_name = circuit_name[:20].translate(_SAFE_NAME_TABLE)
+    return f"{prefix}{hash_part}-{safe_name}"
+
+# Phase gate thresholds with golden ratio spacing, aligned to Phase
+# declaration order; precomputed once instead of a per-call dict build
+_PHASES = tuple(Phase)
+_PHASE_INDEX = {phase: i for i, phase in enumerate(_PHASES)}
+_PHASE_THRESHOLDS = (
+    0.0,                         # KENL: always pass if exists
+    SNAP_IN_THRESHOLD * 0.6,     # AWI: 42%
+    SNAP_IN_THRESHOLD * 0.85,    # ATOM: 59.5%
+    SNAP_IN_THRESHOLD,           # SAIF: 70%
+    SNAP_IN_THRESHOLD            # SPIRAL: 70%
+)
 
 def validate_phase_gate(coherence: CoherenceMetrics, phase: Phase) -> bool:
     """Phase gate validation with golden ratio spacing"""
-    thresholds = {
-        Phase.KENL: 0,                          # Always pass if exists
-        Phase.AWI: SNAP_IN_THRESHOLD * 0.6,     # 42%
-        Phase.ATOM: SNAP_IN_THRESHOLD * 0.85,   # 59.5%
-        Phase.SAIF: SNAP_IN_THRESHOLD,          # 70%
-        Phase.SPIRAL: SNAP_IN_THRESHOLD         # 70%
-    }
-    return coherence.score >= thresholds[phase]
+    return coherence.score >= _PHASE_THRESHOLDS[_PHASE_INDEX[phase]]
+
+# Word tokens for the compiled kernel: maximal runs of non-whitespace bytes
+_WORD_RE = re.compile(rb'\S+')
+
+# 64-bit FNV-1a constants for word/bigram fingerprinting in the kernel
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+
+# log2 of small integer counts, precomputed once (16 KiB, L1-resident);
+# covers typical circuit descriptions so the entropy reduction becomes a
+# table gather instead of per-bin log2 calls
+_LOG2_TABLE = np.log2(np.arange(1, 2048, dtype=np.float64))
+
+def _metrics_core(buf, word_starts, word_ends):
+    """
+    Single-pass numeric core for the coherence metrics.
+
+    Takes the UTF-8 byte buffer plus word start/end index arrays and
+    returns (curl, divergence, potential, entropy_raw). Compiled with
+    numba when available; sees only NumPy arrays and scalars so it
+    lowers cleanly to native loops.
+    """
+    n = buf.size
+    n_words = word_starts.size
+
+    # Entropy: 256-bin byte histogram with ASCII case folding
+    hist = np.zeros(256, dtype=np.int64)
+    for i in range(n):
+        c = buf[i]
+        if 65 <= c <= 90:
+            c |= 0x20
+        hist[c] += 1
+    entropy_raw = 0.0
+    if n > 0:
+        inv_n = 1.0 / n
+        for b in range(256):
+            if hist[b] > 0:
+                p = hist[b] * inv_n
+                entropy_raw -= p * math.log2(p)
+
+    # Divergence: sentence-length variance via Welford, sentences being
+    # '.'-delimited segments and lengths their whitespace-run word counts
+    mean = 0.0
+    m2 = 0.0
+    n_sentences = 0
+    seg_words = 0
+    seg_has_text = False
+    in_token = False
+    for i in range(n):
+        c = buf[i]
+        if c == 46:  # '.'
+            if seg_has_text:
+                n_sentences += 1
+                delta = seg_words - mean
+                mean += delta / n_sentences
+                m2 += delta * (seg_words - mean)
+            seg_words = 0
+            seg_has_text = False
+            in_token = False
+        elif c == 32 or 9 <= c <= 13:  # whitespace
+            in_token = False
+        else:
+            seg_has_text = True
+            if not in_token:
+                seg_words += 1
+                in_token = True
+    if seg_has_text:
+        n_sentences += 1
+        delta = seg_words - mean
+        mean += delta / n_sentences
+        m2 += delta * (seg_words - mean)
+    if n_sentences > 1:
+        divergence = min(1.0, (m2 / n_sentences) / 100.0)
+    else:
+        divergence = 0.2  # Optimal default
+
+    # Curl + potential: unique bigram/word counts via FNV-1a fingerprints
+    # in open-addressed tables (0 marks an empty slot)
+    capacity = 1
+    while capacity < n_words * 2 + 2:
+        capacity <<= 1
+    slot_mask = capacity - 1
+    word_table = np.zeros(capacity, dtype=np.uint64)
+    bigram_table = np.zeros(capacity, dtype=np.uint64)
+    unique_words = 0
+    unique_bigrams = 0
+    prev_hash = np.uint64(0)
+    for w in range(n_words):
+        h = np.uint64(_FNV_OFFSET)
+        for i in range(word_starts[w], word_ends[w]):
+            h = (h ^ np.uint64(buf[i])) * np.uint64(_FNV_PRIME)
+        if h == np.uint64(0):
+            h = np.uint64(1)
+        j = np.int64(h & np.uint64(slot_mask))
+        while True:
+            v = word_table[j]
+            if v == np.uint64(0):
+                word_table[j] = h
+                unique_words += 1
+                break
+            if v == h:
+                break
+            j = (j + 1) & slot_mask
+        if w > 0:
+            bh = (prev_hash * np.uint64(_FNV_PRIME)) ^ h
+            if bh == np.uint64(0):
+                bh = np.uint64(1)
+            j = np.int64(bh & np.uint64(slot_mask))
+            while True:
+                v = bigram_table[j]
+                if v == np.uint64(0):
+                    bigram_table[j] = bh
+                    unique_bigrams += 1
+                    break
+                if v == bh:
+                    break
+                j = (j + 1) & slot_mask
+        prev_hash = h
+
+    curl = 1.0 - unique_bigrams / max(n_words - 1, 1)
+    potential = unique_words / max(n_words, 1)
+
+    return curl, divergence, potential, entropy_raw
+
+# No cache=True: this file is loaded both as a script and dynamically via
+# importlib (the hyphenated name rules out a plain import), and numba's
+# on-disk cache keys the defining module, so entries written under one
+# loading style fail to deserialize under the other.
+if _HAVE_NUMBA:
+    _metrics_core = njit(fastmath=True)(_metrics_core)
+
+_MASK64 = (1 << 64) - 1
+
+def _metrics_core_py(raw: bytes):
+    """
+    Pure-Python metrics fallback used when numba is unavailable.
+
+    One streaming pass over the byte buffer feeds curl, divergence and
+    potential simultaneously (word fingerprints, bigram set, Welford
+    sentence variance) instead of materialising word lists, pair lists
+    and sentence splits as separate temporaries.
+    """
+    word_count = 0
+    word_hashes = set()
+    bigrams = set()
+    prev_hash = 0
+    cur_hash = 0
+    in_word = False
+
+    n_sentences = 0
+    mean = 0.0
+    m2 = 0.0
+    seg_words = 0
+    seg_has_text = False
+    in_seg_token = False
+
+    for c in raw:
+        is_ws = c == 32 or 9 <= c <= 13
+
+        # Whitespace-delimited words: FNV-1a fingerprint per word
+        if is_ws:
+            if in_word:
+                h = cur_hash or 1
+                word_hashes.add(h)
+                if word_count > 0:
+                    # Single 64-bit fingerprint per bigram, same mix as
+                    # the jitted kernel: int set inserts, no tuples
+                    bigrams.add(((prev_hash * _FNV_PRIME) ^ h) & _MASK64)
+                prev_hash = h
+                word_count += 1
+                in_word = False
+        else:
+            if not in_word:
+                cur_hash = _FNV_OFFSET
+                in_word = True
+            cur_hash = ((cur_hash ^ c) * _FNV_PRIME) & _MASK64
+
+        # '.'-delimited sentence segments: running Welford variance of
+        # per-segment word counts (a dot ends the segment token too)
+        if c == 46:
+            if seg_has_text:
+                n_sentences += 1
+                delta = seg_words - mean
+                mean += delta / n_sentences
+                m2 += delta * (seg_words - mean)
+            seg_words = 0
+            seg_has_text = False
+            in_seg_token = False
+        elif is_ws:
+            in_seg_token = False
+        else:
+            seg_has_text = True
+            if not in_seg_token:
+                seg_words += 1
+                in_seg_token = True
+
+    if in_word:
+        h = cur_hash or 1
+        word_hashes.add(h)
+        if word_count > 0:
+            bigrams.add(((prev_hash * _FNV_PRIME) ^ h) & _MASK64)
+        word_count += 1
+    if seg_has_text:
+        n_sentences += 1
+        delta = seg_words - mean
+        mean += delta / n_sentences
+        m2 += delta * (seg_words - mean)
+
+    # Curl: detect repeated patterns (circular reasoning)
+    curl = 1.0 - len(bigrams) / max(word_count - 1, 1)
+
+    # Divergence: sentence length variation
+    if n_sentences > 1:
+        divergence = min(1.0, (m2 / n_sentences) / 100.0)
+    else:
+        divergence = 0.2  # Optimal default
+
+    # Potential: lexical diversity
+    potential = len(word_hashes) / max(word_count, 1)
+
+    # Entropy: byte distribution via a 256-bin histogram (SIMD-backed
+    # bincount/log2 instead of a per-character Counter + generator)
+    b = np.frombuffer(raw, dtype=np.uint8)
+    if b.size > 0:
+        # ASCII case fold (OR 0x20 on A-Z) instead of a str.lower() copy
+        b = np.where((b >= 65) & (b <= 90), b | 0x20, b)
+        counts = np.bincount(b, minlength=256)
+        nz = counts[counts > 0]
+        if b.size <= _LOG2_TABLE.size:
+            logs = _LOG2_TABLE[nz - 1]
+        else:
+            logs = np.log2(nz)
+        # -sum((c/T)*log2(c/T)) == log2(T) - sum(c*log2(c))/T, which
+        # keeps the division out of the reduction
+        entropy_raw = math.log2(b.size) - float((nz * logs).sum()) / b.size
+    else:
+        entropy_raw = 0.0
+
+    return curl, divergence, potential, entropy_raw
+
+# Memoized CoherenceMetrics keyed on a 64-bit content hash of the input
+# bytes; frozen dataclasses make sharing cached instances safe
+_ANALYSIS_CACHE: Dict[int, CoherenceMetrics] = {}
+_ANALYSIS_CACHE_MAX = 1024
 
 def analyze_circuit_coherence(
     circuit_description: str,
@@ -93,53 +450,56 @@ def analyze_circuit_coherence(
     This is a simplified version - in production, this would call
     the wave-toolkit via MCP or direct import.
     """
-    combined_text = f"{circuit_description}\n{theoretical_claim}\n{execution_result}"
-    words = combined_text.split()
-
-    # Calculate metrics (simplified - production uses full wave analysis)
+    # Encode each part once and join at the byte level: no combined str,
+    # no .lower() copy, no repeated full-text scans
+    raw = b'\n'.join(
+        part.encode('utf-8', 'replace')
+        for part in (circuit_description, theoretical_claim, execution_result)
+    )
 
-    # Curl: detect repeated patterns (circular reasoning)
-    word_pairs = [f"{words[i]} {words[i+1]}" for i in range(len(words)-1)]
-    unique_pairs = len(set(word_pairs))
-    curl = 1.0 - (unique_pairs / max(len(word_pairs), 1))
+    # The metrics are a pure function of the byte buffer, so repeated
+    # re-validations (test suites, notebook re-runs) hit the cache
+    key = _content_key(raw)
+    cached = _ANALYSIS_CACHE.get(key)
+    if cached is not None:
+        return cached
 
-    # Divergence: sentence length variation
-    sentences = combined_text.split('.')
-    lengths = [len(s.split()) for s in sentences if s.strip()]
-    if len(lengths) > 1:
-        avg_len = sum(lengths) / len(lengths)
-        variance = sum((l - avg_len) ** 2 for l in lengths) / len(lengths)
-        divergence = min(1.0, variance / 100)
+    # Calculate metrics (simplified - production uses full wave analysis)
+    if _HAVE_NUMBA:
+        starts = []
+        ends = []
+        for m in _WORD_RE.finditer(raw):
+            starts.append(m.start())
+            ends.append(m.end())
+        buf = np.frombuffer(raw, dtype=np.uint8)
+        curl, divergence, potential, entropy_raw = _metrics_core(
+            buf,
+            np.array(starts, dtype=np.int64),
+            np.array(ends, dtype=np.int64),
+        )
     else:
-        divergence = 0.2  # Optimal default
+        curl, divergence, potential, entropy_raw = _metrics_core_py(raw)
 
-    # Potential: lexical diversity
-    unique_words = len(set(words))
-    potential = unique_words / max(len(words), 1)
-
-    # Entropy: character distribution
-    from collections import Counter
-    char_counts = Counter(combined_text.lower())
-    total_chars = sum(char_counts.values())
-    if total_chars > 0:
-        import math
-        entropy_raw = -sum(
-            (c/total_chars) * math.log2(c/total_chars)
-            for c in char_counts.values() if c > 0
-        )
+    if raw:
         entropy = min(1.0, entropy_raw / 5.0)  # Normalize
     else:
         entropy = 0.5
 
     score = calculate_coherence(curl, divergence, potential, entropy)
 
-    return CoherenceMetrics(
+    metrics = CoherenceMetrics(
         curl=curl,
         divergence=divergence,
         potential=potential,
         entropy=entropy,
         score=score
     )
+    if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_MAX:
+        _ANALYSIS_CACHE.clear()
+    _ANALYSIS_CACHE[key] = metrics
+    return metrics
+
+analyze_circuit_coherence.cache_clear = _ANALYSIS_CACHE.clear
 
 def validate_quantum_circuit(
     circuit_name: str,
@@ -159,22 +519,19 @@ def validate_quantum_circuit(
         execution_result=execution_result
     )
 
-    # Run through phase gates
-    phases_passed: List[Phase] = []
-    for phase in Phase:
-        if validate_phase_gate(coherence, phase):
-            phases_passed.append(phase)
-        else:
-            break
+    # Run through phase gates: thresholds are monotonic non-decreasing,
+    # so the passed prefix is a single bisect (>= pass == threshold <= score)
+    # and the bitmask of passed phases is just the k low bits
+    k = bisect.bisect_right(_PHASE_THRESHOLDS, coherence.score)
 
     validation = QuantumCircuitValidation(
         circuit_name=circuit_name,
         minecraft_schematic=minecraft_schematic,
         qiskit_circuit=qiskit_code,
         theoretical_claim=theoretical_claim,
-        validation_result=len(phases_passed) == len(Phase),
+        validation_result=k == len(_PHASES),
         coherence=coherence,
-        phases_passed=phases_passed,
+        phases_passed=(1 << k) - 1,
         atom_tag=generate_atom_tag(circuit_name),
         timestamp=datetime.now().isoformat()
     )
@@ -184,13 +541,98 @@ def validate_quantum_circuit(
 
     return validation
 
-def persist_atom_entry(validation: QuantumCircuitValidation) -> None:
-    """Persist validation to ATOM trail JSONL file"""
-    trail_dir = os.path.join(os.getcwd(), '.atom-trail')
-    os.makedirs(trail_dir, exist_ok=True)
+def validate_quantum_circuits(
+    circuits: Iterable[Dict[str, Any]]
+) -> List[QuantumCircuitValidation]:
+    """
+    Validate many circuits in one batch.
 
-    trail_file = os.path.join(trail_dir, 'quantum-circuits.jsonl')
+    Each item is a dict of validate_quantum_circuit keyword arguments.
+    The batch runs inside a single ATOM trail session, so the trail is
+    written with large buffered appends and flushed once at the end
+    instead of per validation - the preferred entry point for parameter
+    sweeps and notebook export ingestion.
+    """
+    results: List[QuantumCircuitValidation] = []
+    with atom_trail_batch():
+        for circuit in circuits:
+            results.append(validate_quantum_circuit(**circuit))
+    return results
+
+class AtomTrailWriter:
+    """
+    Buffered append-mode writer for the ATOM trail JSONL file.
+
+    Keeps the file handle open across validations so each append is a
+    buffered write instead of a full open/write/close cycle. Outside
+    batch mode every append still flushes immediately, preserving the
+    old one-line-per-validation durability; inside atom_trail_batch()
+    flushing is deferred until the batch exits.
+    """
 
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = None
+        self._batch_depth = 0
+
+    def _handle(self):
+        if self._fh is None or self._fh.closed:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._fh = open(self.path, 'ab', buffering=1 << 20)
+        return self._fh
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        self._handle().write(_dump_entry(entry) + b'\n')
+        if self._batch_depth == 0:
+            self._fh.flush()
+
+    def flush(self) -> None:
+        if self._fh is not None and not self._fh.closed:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None and not self._fh.closed:
+            self._fh.close()
+
+_trail_writer: Optional[AtomTrailWriter] = None
+
+def _get_trail_writer() -> AtomTrailWriter:
+    """Return the trail writer for the current working directory."""
+    global _trail_writer
+    path = os.path.join(os.getcwd(), '.atom-trail', 'quantum-circuits.jsonl')
+    if _trail_writer is None or _trail_writer.path != path:
+        if _trail_writer is not None:
+            _trail_writer.close()
+        _trail_writer = AtomTrailWriter(path)
+    return _trail_writer
+
+def _close_trail_writer() -> None:
+    if _trail_writer is not None:
+        _trail_writer.close()
+
+atexit.register(_close_trail_writer)
+
+@contextmanager
+def atom_trail_batch():
+    """
+    Defer ATOM trail flushes while validating many circuits.
+
+    Usage:
+        with atom_trail_batch():
+            for circuit in circuits:
+                validate_quantum_circuit(...)
+    """
+    writer = _get_trail_writer()
+    writer._batch_depth += 1
+    try:
+        yield writer
+    finally:
+        writer._batch_depth -= 1
+        if writer._batch_depth == 0:
+            writer.flush()
+
+def persist_atom_entry(validation: QuantumCircuitValidation) -> None:
+    """Persist validation to ATOM trail JSONL file"""
     entry = {
         'atomTag': validation.atom_tag,
         'circuitName': validation.circuit_name,
@@ -205,16 +647,54 @@ def persist_atom_entry(validation: QuantumCircuitValidation) -> None:
             'entropy': validation.coherence.entropy,
             'score': validation.coherence.score
         },
-        'phasesPassed': [p.value for p in validation.phases_passed],
+        'phasesPassed': [p.value for p in validation.phases_passed_list],
         'timestamp': validation.timestamp
     }
 
-    with open(trail_file, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    _get_trail_writer().append(entry)
+
+def _load_trail_summary(summary_file: str) -> Optional[Dict[str, Any]]:
+    """Load the sidecar summary, or None if missing/unreadable."""
+    try:
+        with open(summary_file, 'rb') as f:
+            summary = _load_entry(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(summary, dict) or not isinstance(summary.get('last_offset'), int):
+        return None
+    return summary
+
+def _write_trail_summary(
+    summary_file: str,
+    total: int,
+    coherence_sum: float,
+    phase_count: Dict[str, int],
+    last_offset: int
+) -> None:
+    summary = {
+        'total': total,
+        'coherence_sum': coherence_sum,
+        'phase_count': phase_count,
+        'last_offset': last_offset
+    }
+    with open(summary_file, 'wb') as f:
+        f.write(_dump_entry(summary))
 
 def get_vortex_health() -> Dict[str, Any]:
-    """Query vortex health for all quantum circuit validations"""
-    trail_file = os.path.join(os.getcwd(), '.atom-trail', 'quantum-circuits.jsonl')
+    """
+    Query vortex health for all quantum circuit validations.
+
+    Maintains a sidecar summary next to the trail so repeated queries
+    only parse lines appended since the previous call; a full scan is
+    needed only when the summary is missing or stale.
+    """
+    trail_dir = os.path.join(os.getcwd(), '.atom-trail')
+    trail_file = os.path.join(trail_dir, 'quantum-circuits.jsonl')
+    summary_file = os.path.join(trail_dir, 'quantum-circuits.summary.json')
+
+    # Make in-process batched appends visible before reading
+    if _trail_writer is not None and _trail_writer.path == trail_file:
+        _trail_writer.flush()
 
     if not os.path.exists(trail_file):
         return {
@@ -227,16 +707,37 @@ def get_vortex_health() -> Dict[str, Any]:
     total = 0
     coherence_sum = 0.0
     phase_count = {p.value: 0 for p in Phase}
-
-    with open(trail_file, 'r') as f:
-        for line in f:
+    start_offset = 0
+
+    size = os.path.getsize(trail_file)
+    summary = _load_trail_summary(summary_file)
+    if summary is not None and 0 <= summary['last_offset'] <= size:
+        total = int(summary.get('total', 0))
+        coherence_sum = float(summary.get('coherence_sum', 0.0))
+        for phase, count in summary.get('phase_count', {}).items():
+            if phase in phase_count:
+                phase_count[phase] = count
+        start_offset = summary['last_offset']
+
+    if start_offset < size:
+        # mmap the trail and split on newlines at C level instead of
+        # iterating the file object line by line
+        with open(trail_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = mm.rfind(b'\n', start_offset) + 1  # complete lines only
+                data = mm[start_offset:end] if end > start_offset else b''
+        for line in data.split(b'\n'):
             if not line.strip():
                 continue
-            entry = json.loads(line)
+            entry = _load_entry(line)
             total += 1
             coherence_sum += entry['coherence']['score']
             for phase in entry['phasesPassed']:
                 phase_count[phase] += 1
+        _write_trail_summary(
+            summary_file, total, coherence_sum, phase_count,
+            start_offset + len(data)
+        )
 
     avg_coherence = coherence_sum / total if total > 0 else 0
 
@@ -272,7 +773,7 @@ qc.measure_all()
 
 print(f"ATOM Tag: {validation.atom_tag}")
 print(f"Coherence Score: {validation.coherence.score:.1f}%")
-print(f"Phases Passed: {[p.value for p in validation.phases_passed]}")
+print(f"Phases Passed: {[p.value for p in validation.phases_passed_list]}")
 print(f"Snap-In: {'Achieved' if validation.validation_result else 'Not Yet'}")
 
 # Check overall vortex health